@@ -1,14 +1,337 @@
+import os
 import time
+import argparse
 import random
 import logging
+import functools
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, Mapping, Optional, Tuple
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.common.driver_finder import DriverFinder
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, ElementClickInterceptedException,
+    StaleElementReferenceException, WebDriverException, NoSuchWindowException
+)
+
+
+# Selector candidates for each target, as (By, selector) pairs tried in order.
+# Built once at import and read-only afterwards. CSS that matches only by
+# position or shared classes stays behind the text match that pins the entry.
+SELECTORS: Mapping[str, Tuple[Tuple[str, str], ...]] = MappingProxyType({
+    "google_cookie": (
+        (By.CSS_SELECTOR, "#L2AGLb"),
+    ),
+    "lectra_link": (
+        (By.CSS_SELECTOR, 'a[href*="lectra.com"] h3.LC20lb'),
+        (By.XPATH, "//h3[contains(text(), 'Lectra')]/parent::a"),
+        (By.CSS_SELECTOR, 'a[href*="lectra.com"]:not([href*="careers"])'),
+    ),
+    "lectra_cookie": (
+        (By.CSS_SELECTOR, "#ppms_cm_agree-to-all"),
+        (By.XPATH, "//button[contains(text(), 'Accept all')]"),
+    ),
+    "language_button": (
+        (By.CSS_SELECTOR, "#block-lectra-b5-languageswitcherinterfacetext-2 > button"),
+        (By.CSS_SELECTOR, "div[id='block-lectra-b5-languageswitcherinterfacetext-2'] button"),
+        (By.XPATH, '//button[contains(text(), "Languages")]'),
+    ),
+    "english_link": (
+        (By.CSS_SELECTOR, '#block-lectra-b5-languageswitcherinterfacetext-2 a[hreflang="en"]'),
+        (By.CSS_SELECTOR, 'a.language-link[hreflang="en"][href="/en"]'),
+        (By.XPATH, '//div[@id="block-lectra-b5-languageswitcherinterfacetext-2"]//a[normalize-space()="English"]'),
+    ),
+    "fashion_button": (
+        (By.XPATH, '//button[contains(text(), "Fashion")]'),
+    ),
+    "lectra_fashion_link": (
+        (By.CSS_SELECTOR, 'a[href="/en/fashion"]'),
+        (By.XPATH, '//a[normalize-space()="Lectra & Fashion"]'),
+    ),
+    "automotive_tab": (
+        (By.XPATH, '//button[contains(text(), "Automotive")]'),
+        (By.CSS_SELECTOR, '#block-lectra-b5-mainnavigation > ul > li:nth-of-type(2) > button'),
+    ),
+    "furniture_tab": (
+        (By.XPATH, '//button[contains(text(), "Furniture")]'),
+        (By.CSS_SELECTOR, '#block-lectra-b5-mainnavigation > ul > li:nth-of-type(3) > button'),
+    ),
+    "about_us_button": (
+        (By.XPATH, '//div[@id="block-lectra-b5-headernavigation"]//button[@type="button"][normalize-space()="About us"]'),
+        (By.CSS_SELECTOR, 'button[class="nav-link dropdown-toggle ext-highlight"]'),
+    ),
+    "discover_lectra_link": (
+        (By.CSS_SELECTOR, '#block-lectra-b5-headernavigation a[href="/en/discover-lectra"]'),
+        (By.XPATH, '//div[@id="block-lectra-b5-headernavigation"]//ul//a[@class="nav-link"][normalize-space()="Discover Lectra"]'),
+        (By.CSS_SELECTOR, 'div[id="block-lectra-b5-headernavigation"] ul a[class="nav-link ext-highlight"]'),
+    ),
+    "view_job_openings": (
+        (By.XPATH, '//*[@id="block-lectra-b5-content"]//a[contains(text(), "View job openings")]'),
+        (By.CSS_SELECTOR, 'div[class="background--greige layout layout--onecol"] a[class="gtm-cta"]'),
+    ),
+    "job_opportunities_link": (
+        (By.CSS_SELECTOR, 'a.gtm-cta[href="https://careers.lectra.com/"]'),
+        (By.XPATH, '//a[contains(text(), "Our job opportunities")]'),
+    ),
+    "career_cookie": (
+        (By.CSS_SELECTOR, '#cookie-accept'),
+    ),
+    "search_jobs_button": (
+        (By.CSS_SELECTOR, '.search.displayDT input.keywordsearch-button[type="submit"][value="Search jobs"]'),
+        (By.CSS_SELECTOR, '#search-wrapper > div > form > div > div > div:nth-of-type(2) > div:nth-of-type(2) > div:nth-of-type(1) > input'),
+    ),
+    "first_job": (
+        (By.CSS_SELECTOR, '.jobTitle-link'),
+        (By.CSS_SELECTOR, '#searchresults tbody > tr:first-child > td.colTitle'),
+    ),
+})
+
+# Third-party trackers the scenario never inspects. ppms scripts are left
+# alone because they render the Lectra cookie banner that step 5 accepts.
+BLOCKED_URL_PATTERNS = [
+    "*googletagmanager.com*",
+    "*google-analytics.com*",
+    "*doubleclick.net*",
+    "*facebook.net*",
+    "*hotjar.com*",
+]
+
+# Heavy static resources no selector depends on; blocked unless block_resources=False
+RESOURCE_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp",
+    "*.woff", "*.woff2", "*.ttf",
+    "*.mp4", "*.webm",
+]
+
+# Pages preloaded in background tabs so their load overlaps earlier steps:
+# Lectra during the Google steps, careers during the Lectra menus
+LECTRA_URL = "https://www.lectra.com/"
+CAREERS_URL = "https://careers.lectra.com/"
+
+# One logger shared by every instance; each instance logs through an InstanceLogger
+LOGGER = logging.getLogger("lectra")
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+_LOGGER_SETUP_LOCK = threading.Lock()
+
+# Upper bound in seconds for the async click, scroll and removal scripts. They rely on
+# requestAnimationFrame, which Chrome pauses in hidden windows, so a stalled script
+# falls back to WebDriver calls instead of waiting out Selenium's 30s default.
+# Must stay above the 3s banner-removal timeout.
+SCRIPT_TIMEOUT = 5
+
+# Page landmarks used as step pre/postconditions
+GOOGLE_SEARCH_BOX = (By.NAME, "q")
+GOOGLE_RESULTS = (By.ID, "search")
+LECTRA_LANGUAGE_SWITCHER = (By.ID, "block-lectra-b5-languageswitcherinterfacetext-2")
+LECTRA_MAIN_NAVIGATION = (By.ID, "block-lectra-b5-mainnavigation")
+LECTRA_HEADER_NAVIGATION = (By.ID, "block-lectra-b5-headernavigation")
+LECTRA_CONTENT = (By.ID, "block-lectra-b5-content")
+CAREERS_SEARCH_FORM = (By.ID, "search-wrapper")
+
+
+@dataclass(frozen=True)
+class Step:
+    """A scenario step with the page landmarks it needs before and guarantees after running."""
+    name: str
+    action: Callable[[], bool]
+    precondition: Optional[Tuple[str, str]] = None
+    postcondition: Optional[Tuple[str, str]] = None
+
+
+@functools.lru_cache(maxsize=None)
+def _driver_paths():
+    """Resolve the ChromeDriver and Chrome paths through Selenium Manager once per process."""
+    finder = DriverFinder(Service(), webdriver.ChromeOptions())
+    return finder.get_driver_path(), finder.get_browser_path()
+
+
+class InstanceLogger(logging.LoggerAdapter):
+    """View of the shared lectra logger with its own level, tagging messages with the instance."""
+    
+    def __init__(self, instance, level):
+        super().__init__(LOGGER, {"instance": f"{id(instance):x}"})
+        if isinstance(level, str):
+            try:
+                level = logging.getLevelNamesMapping()[level.upper()]
+            except KeyError:
+                raise ValueError(f"Unknown log level: {level!r}") from None
+        self.level = level
+    
+    def isEnabledFor(self, level):
+        return level >= self.level and self.logger.isEnabledFor(level)
+    
+    def process(self, msg, kwargs):
+        return f"[{self.extra['instance']}] {msg}", kwargs
+
+
+def instance_logger(instance, level):
+    """Return a logger for one automation instance, setting up the shared lectra logger on first use."""
+    with _LOGGER_SETUP_LOCK:
+        if not LOGGER.handlers:
+            handler = logging.StreamHandler()
+            handler.setFormatter(logging.Formatter(LOG_FORMAT))
+            LOGGER.addHandler(handler)
+            # Instances filter by their own level; root logging is left alone
+            LOGGER.setLevel(logging.DEBUG)
+            LOGGER.propagate = False
+    return InstanceLogger(instance, level)
+
+
+# Returns the first visible, enabled element matching any of the given
+# [by, selector] pairs, or null. Shared by the lookup scripts below.
+FIND_FIRST_FN = """
+function findFirst(selectors) {
+    for (const [by, selector] of selectors) {
+        let el = null;
+        try {
+            if (by === 'xpath') {
+                el = document.evaluate(
+                    selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+                ).singleNodeValue;
+            } else {
+                el = document.querySelector(selector);
+            }
+        } catch (e) {
+            continue;
+        }
+        if (el && el.offsetParent !== null && !el.disabled) {
+            return el;
+        }
+    }
+    return null;
+}
+"""
+
+# Single WebDriver round-trip lookup over a list of candidates
+FIND_FIRST_JS = FIND_FIRST_FN + "return findFirst(arguments[0]);"
+
+# Same lookup plus whether the page has finished loading, for elements that may never appear
+FIND_OPTIONAL_JS = FIND_FIRST_FN + """
+return {element: findFirst(arguments[0]), complete: document.readyState === 'complete'};
+"""
+
+# Scrolls down a screen per animation frame until a candidate shows up,
+# then centres it; resolves with the element, or null at the page bottom.
+SCROLL_UNTIL_FOUND_JS = FIND_FIRST_FN + """
+const selectors = arguments[0];
+const done = arguments[arguments.length - 1];
+let scrolls = 0;
+(function step() {
+    const el = findFirst(selectors);
+    if (el) {
+        el.scrollIntoView({block: 'center'});
+        done(el);
+        return;
+    }
+    const atBottom = window.innerHeight + window.scrollY >= document.body.scrollHeight;
+    if (atBottom || ++scrolls > 50) {
+        done(null);
+        return;
+    }
+    window.scrollBy(0, 1000);
+    requestAnimationFrame(step);
+})();
+"""
+
+# Position of arguments[0], whether its top edge is inside the viewport, and
+# the document ready state
+LAYOUT_STATE_JS = """
+const top = arguments[0].getBoundingClientRect().top;
+return [top, top >= 0 && top < window.innerHeight, document.readyState];
+"""
+
+# Scrolls arguments[0] into view, lets layout settle for two frames, then
+# clicks it; resolves with 'ok', 'hidden' or 'err:<message>'.
+SCROLL_AND_CLICK_JS = """
+const el = arguments[0];
+const done = arguments[arguments.length - 1];
+el.scrollIntoView({block: 'center'});
+requestAnimationFrame(() => requestAnimationFrame(() => {
+    const rect = el.getBoundingClientRect();
+    if (rect.width === 0 || rect.height === 0) {
+        done('hidden');
+        return;
+    }
+    try {
+        el.click();
+        done('ok');
+    } catch (e) {
+        done('err:' + e.message);
+    }
+}));
+"""
+
+# Installed once per tab and run before any page script on every navigation.
+# All patches are configurable so re-running on the same document is harmless.
+STEALTH_JS = """
+(() => {
+    const patch = (obj, prop, value) =>
+        Object.defineProperty(obj, prop, {get: () => value, configurable: true});
+    patch(navigator, 'webdriver', undefined);
+    patch(navigator, 'languages', ['en-US', 'en']);
+    patch(navigator, 'plugins', [1, 2, 3, 4, 5]);
+    window.chrome = window.chrome || {};
+    window.chrome.runtime = window.chrome.runtime || {};
+})();
+"""
+
+# Index of the first (By, selector) candidate that matches the given element, or -1
+MATCHED_SELECTOR_JS = """
+const [el, selectors] = arguments;
+return selectors.findIndex(([by, selector]) => {
+    try {
+        if (by !== 'xpath') {
+            return el.matches(selector);
+        }
+        const hits = document.evaluate(
+            selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        for (let i = 0; i < hits.snapshotLength; i++) {
+            if (hits.snapshotItem(i) === el) {
+                return true;
+            }
+        }
+    } catch (e) {}
+    return false;
+});
+"""
+
+# URL and title of the current document, read in one round-trip
+PAGE_STATE_JS = "return {url: location.href, title: document.title};"
+
+# Clicks arguments[0] and resolves true once it is detached or hidden, or
+# with the current state after arguments[1] milliseconds.
+CLICK_AND_AWAIT_REMOVAL_JS = """
+const el = arguments[0];
+const timeoutMs = arguments[1];
+const done = arguments[arguments.length - 1];
+const gone = () => !el.isConnected || el.offsetParent === null;
+let timer = null;
+const observer = new MutationObserver(() => {
+    if (gone()) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(true);
+    }
+});
+observer.observe(document.body, {subtree: true, childList: true, attributes: true});
+el.click();
+if (gone()) {
+    observer.disconnect();
+    done(true);
+} else {
+    timer = setTimeout(() => {
+        observer.disconnect();
+        done(gone());
+    }, timeoutMs);
+}
+"""
 
 
 class LectraTestAutomation:
@@ -16,27 +339,98 @@ class LectraTestAutomation:
     Test automation class for Lectra website scenario testing.
     """
     
-    def __init__(self, headless=False, timeout=10):
+    # Pools keep several instances alive at once, so skip the per-instance __dict__
+    __slots__ = (
+        "timeout", "blocked_url_patterns", "debugger_address", "driver_path",
+        "disable_css", "human_like", "stealth_typing",
+        "driver", "wait", "short_wait", "optional_wait",
+        "initial_window", "original_window", "current_window", "handles_before_click", "prefetched_windows",
+        "logger",
+    )
+    
+    def __init__(self, headless=True, timeout=10, disable_css=False, human_like=False,
+                 debugger_address=None, block_resources=True, driver_path=None, log_level=None):
         """Initialize the test automation with configurable options."""
         self.timeout = timeout
+        self.blocked_url_patterns = BLOCKED_URL_PATTERNS + (RESOURCE_URL_PATTERNS if block_resources else [])
+        self.debugger_address = debugger_address
+        # Explicit chromedriver for locked-down machines; skips Selenium Manager
+        self.driver_path = driver_path
+        self.disable_css = disable_css
+        self.human_like = human_like
+        # Per-character typing only matters when someone is watching the browser
+        self.stealth_typing = human_like and not headless
         self.driver = None
         self.wait = None
+        self.short_wait = None
+        self.optional_wait = None
+        # Tab the instance started on; reset() returns to it
+        self.initial_window = None
         self.original_window = None
+        # Handle of the tab the driver is on, kept in step with every switch
+        self.current_window = None
+        self.handles_before_click = set()
+        # Window handle of each preloaded tab, keyed by the URL it was opened with
+        self.prefetched_windows = {}
         
-        # Setup logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s'
-        )
-        self.logger = logging.getLogger(__name__)
+        # Headless runs (pools, CI) only report problems unless asked otherwise
+        if log_level is None:
+            log_level = logging.WARNING if headless else logging.INFO
+        self.logger = instance_logger(self, log_level)
         
         # Setup Chrome driver with options
         self._setup_driver(headless)
     
+    @classmethod
+    def from_pool(cls, debugger_address="127.0.0.1:9222", **kwargs):
+        """Attach to an already running Chrome started with --remote-debugging-port."""
+        return cls(debugger_address=debugger_address, **kwargs)
+    
     def _setup_driver(self, headless):
         """Configure and initialize the Chrome WebDriver."""
         chrome_options = webdriver.ChromeOptions()
         
+        # Return from driver.get at DOMContentLoaded; explicit waits gate on the elements we need
+        chrome_options.page_load_strategy = "eager"
+        
+        if self.debugger_address:
+            # Launch flags cannot be applied to a browser that is already running
+            chrome_options.debugger_address = self.debugger_address
+        else:
+            self._add_launch_options(chrome_options, headless)
+        
+        try:
+            if self.driver_path:
+                service = Service(self.driver_path)
+            else:
+                # Resolved by Selenium Manager on the first instance only
+                driver_path, browser_path = _driver_paths()
+                service = Service(driver_path)
+                # A preset Service skips Selenium Manager, which would otherwise point
+                # Chrome at the Chrome for Testing build it may have downloaded
+                if browser_path and not self.debugger_address:
+                    chrome_options.binary_location = browser_path
+            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            self.wait = WebDriverWait(
+                self.driver, self.timeout, poll_frequency=0.1,
+                ignored_exceptions=(NoSuchElementException, StaleElementReferenceException)
+            )
+            self.short_wait = WebDriverWait(self.driver, 2, poll_frequency=0.05)
+            # Cookie banners may never appear, so their absence must stay cheap
+            self.optional_wait = WebDriverWait(self.driver, 2, poll_frequency=0.1)
+            self.driver.set_script_timeout(SCRIPT_TIMEOUT)
+            self.initial_window = self.current_window = self.driver.current_window_handle
+            self._configure_tab()
+            
+            self.driver.maximize_window()
+            self.logger.info("Chrome driver initialized successfully")
+            
+        except Exception as e:
+            self.logger.error("Failed to initialize Chrome driver: %s", e)
+            raise
+
+    def _add_launch_options(self, chrome_options, headless):
+        """Add the flags and preferences used when launching a new Chrome."""
         # Anti-detection measures
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
@@ -45,143 +439,321 @@ class LectraTestAutomation:
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         
+        # Performance: skip resources and background work the scenario never asserts on
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-renderer-backgrounding")
+        chrome_options.add_argument("--disable-background-timer-throttling")
+        # Keeps animation frames running when a --debug window is covered or minimized
+        chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+        chrome_options.add_argument("--disable-client-side-phishing-detection")
+        
+        content_settings = {"profile.managed_default_content_settings.images": 2}
+        if self.disable_css:
+            # Off by default: several selectors and click targets depend on styled layout
+            content_settings["profile.managed_default_content_settings.stylesheets"] = 2
+        chrome_options.add_experimental_option("prefs", content_settings)
+        
         if headless:
-            chrome_options.add_argument("--headless")
+            chrome_options.add_argument("--headless=new")
+            chrome_options.add_argument("--disable-software-rasterizer")
         else:
+            if os.environ.get("CI"):
+                self.logger.warning("Running a visible browser in CI; headless mode renders less and runs faster")
             chrome_options.add_experimental_option("detach", True)
-        
+
+    def _configure_tab(self):
+        """Apply per-tab DevTools settings; needed again after switching to a new tab."""
+        self._install_stealth_script()
+        self._block_tracking_requests()
+
+    def _install_stealth_script(self):
+        """Apply the stealth patches to every document this tab loads from now on."""
         try:
-            self.driver = webdriver.Chrome(
-                service=Service(ChromeDriverManager().install()), 
-                options=chrome_options
-            )
-            self.wait = WebDriverWait(self.driver, self.timeout)
-            
-            # Remove webdriver property
-            self.driver.execute_script(
-                "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
-            )
-            
-            self.driver.maximize_window()
-            self.logger.info("Chrome driver initialized successfully")
-            
-        except Exception as e:
-            self.logger.error(f"Failed to initialize Chrome driver: {str(e)}")
-            raise
+            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": STEALTH_JS})
+            # The current document was loaded before the script was registered
+            self.driver.execute_script(STEALTH_JS)
+        except WebDriverException as e:
+            self.logger.warning("Could not install stealth script: %s", e)
 
-    def assert_condition(self, condition, message):
-        """Custom assertion with logging."""
+    def _block_tracking_requests(self):
+        """Block tracker and heavy resource requests in the current tab via the Chrome DevTools Protocol."""
         try:
-            assert condition, message
-            self.logger.info(f"✓ ASSERTION PASSED: {message}")
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_url_patterns})
+        except WebDriverException as e:
+            self.logger.warning("Could not block tracking requests: %s", e)
+
+    def _set_blocked_urls(self, patterns):
+        """Replace the blocked URL patterns for the current tab, e.g. to unblock images for one step."""
+        self.blocked_url_patterns = list(patterns)
+        self._block_tracking_requests()
+
+    def assert_condition(self, condition, message):
+        """Custom assertion with logging. Returns whether the condition held."""
+        if condition:
+            self.logger.info("✓ ASSERTION PASSED: %s", message)
             return True
-        except AssertionError as e:
-            self.logger.error(f"✗ ASSERTION FAILED: {str(e)}")
-            raise
+        self.logger.error("✗ ASSERTION FAILED: %s", message)
+        return False
+    
+    def _wait_until_stable(self, element, timeout=0.5):
+        """Wait until the element is in the viewport and its position and document state stop changing."""
+        last_state = []
+
+        def is_stable(driver):
+            state = driver.execute_script(LAYOUT_STATE_JS, element)
+            in_viewport = state[1]
+            stable = in_viewport and state == last_state
+            last_state[:] = state
+            return stable
+
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(is_stable)
+        except TimeoutException:
+            pass
+
+    def _wait_before_retry(self, element, timeout=1):
+        """Wait until the element is clickable again before retrying a click."""
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(
+                EC.element_to_be_clickable(element)
+            )
+        except (TimeoutException, StaleElementReferenceException):
+            pass
     
     def _safe_click(self, element, description="element"):
+        """Click an element in one browser call, falling back to WebDriver clicks with retries."""
+        try:
+            status = self.driver.execute_async_script(SCROLL_AND_CLICK_JS, element)
+        except WebDriverException as e:
+            status = f"err:{str(e)}"
+        
+        if status == "ok":
+            self.logger.info("Successfully clicked %s", description)
+            return True
+        if status == "hidden":
+            self.logger.warning("%s has no size yet, waiting for it to render...", description)
+        else:
+            self.logger.warning("In-browser click failed for %s: %s", description, status[len('err:'):])
+        
+        return self._click_with_retries(element, description)
+    
+    def _click_with_retries(self, element, description="element"):
         """Safely click an element with retry logic."""
         max_retries = 3
         for attempt in range(max_retries):
             try:
                 # Scroll element into view
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                time.sleep(0.5)
+                self._wait_until_stable(element)
                 
                 # Try regular click first
                 element.click()
-                self.logger.info(f"Successfully clicked {description}")
+                self.logger.info("Successfully clicked %s", description)
                 return True
                 
             except ElementClickInterceptedException:
                 if attempt < max_retries - 1:
-                    self.logger.warning(f"Click intercepted for {description}, retrying with JavaScript...")
+                    self.logger.warning("Click intercepted for %s, retrying with JavaScript...", description)
                     try:
                         self.driver.execute_script("arguments[0].click();", element)
-                        self.logger.info(f"Successfully clicked {description} using JavaScript")
+                        self.logger.info("Successfully clicked %s using JavaScript", description)
                         return True
                     except Exception as js_e:
-                        self.logger.warning(f"JavaScript click failed: {str(js_e)}")
-                        time.sleep(1)
+                        self.logger.warning("JavaScript click failed: %s", js_e)
+                        self._wait_before_retry(element)
                 else:
-                    self.logger.error(f"Failed to click {description} after {max_retries} attempts")
+                    self.logger.error("Failed to click %s after %s attempts", description, max_retries)
                     return False
             except Exception as e:
-                self.logger.warning(f"Attempt {attempt + 1} failed for {description}: {str(e)}")
+                self.logger.warning("Attempt %s failed for %s: %s", attempt + 1, description, e)
                 if attempt == max_retries - 1:
                     return False
-                time.sleep(1)
+                self._wait_before_retry(element)
         return False
     
+    def _click_and_await_removal(self, element, description="element", timeout_ms=3000):
+        """Click an element in the browser and wait for it to leave the page in the same call."""
+        try:
+            removed = self.driver.execute_async_script(CLICK_AND_AWAIT_REMOVAL_JS, element, timeout_ms)
+        except WebDriverException as e:
+            self.logger.warning("Failed to click %s: %s", description, e)
+            return False
+        
+        if removed:
+            self.logger.info("Successfully clicked %s", description)
+        else:
+            self.logger.warning("%s still visible after click", description)
+        return removed
+    
+    def _find_first_js(self, selectors):
+        """Return the first visible match among the candidates, or None, without waiting."""
+        return self.driver.execute_script(FIND_FIRST_JS, selectors)
+    
     def _find_element_by_selectors(self, selectors, description="element"):
-        """Find element using multiple selector strategies."""
-        for selector in selectors:
-            try:
-                if selector.startswith("#") or selector.startswith("."):
-                    element = self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, selector)))
-                elif selector.startswith("/") or selector.startswith("("):
-                    element = self.wait.until(EC.element_to_be_clickable((By.XPATH, selector)))
-                else:
-                    element = self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, selector)))
-                
-                self.logger.info(f"Found {description} using selector: {selector}")
-                return element
-            except TimeoutException:
-                continue
+        """Find element using multiple (By, selector) candidates in one browser query."""
+        candidates = tuple(selectors)
+        try:
+            # Poll only while the page has not rendered any candidate yet
+            element = self.wait.until(lambda _: self._find_first_js(candidates))
+            self.logger.info("Found %s", description)
+            # Working out which candidate matched costs a round-trip, so only do it when it gets logged
+            if self.logger.isEnabledFor(logging.DEBUG):
+                index = self.driver.execute_script(MATCHED_SELECTOR_JS, element, candidates)
+                if index >= 0:
+                    self.logger.debug("%s matched %s %r", description, *candidates[index])
+            return element
+        except TimeoutException:
+            self.logger.warning("Could not find %s with any provided selectors", description)
+            return None
+    
+    def _find_optional(self, selectors, description="element"):
+        """Return an optional element if present, waiting at most until the page has fully loaded."""
+        def found_or_loaded(driver):
+            # Only a page that is still loading may yet render the element
+            state = driver.execute_script(FIND_OPTIONAL_JS, selectors)
+            return state if state["element"] is not None or state["complete"] else None
+        
+        try:
+            element = self.optional_wait.until(found_or_loaded)["element"]
+        except TimeoutException:
+            element = None
+        if element is not None:
+            self.logger.info("Found %s", description)
+        return element
+    
+    def _switch_to_window(self, window):
+        """Switch tabs, keeping current_window in step with the driver."""
+        self.driver.switch_to.window(window)
+        self.current_window = window
+    
+    def _probe(self, js):
+        """Read several page properties with a single script round-trip."""
+        return self.driver.execute_script(js)
+    
+    def _wait_for_url(self, fragment):
+        """Wait until the current URL contains the given fragment."""
+        try:
+            self.wait.until(EC.url_contains(fragment))
+            return True
+        except TimeoutException:
+            return False
+    
+    def _scroll_to_element(self, selectors, description="element"):
+        """Scroll in the browser until the element appears and centre it, all in one call."""
+        try:
+            element = self.driver.execute_async_script(SCROLL_UNTIL_FOUND_JS, selectors)
+        except WebDriverException as e:
+            self.logger.warning("In-browser scroll failed for %s: %s", description, e)
+            element = None
         
-        self.logger.warning(f"Could not find {description} with any provided selectors")
-        return None
+        if element:
+            self.logger.info("Found %s", description)
+            return element
+        # Reached the page bottom first; the element may still be rendering
+        return self._find_element_by_selectors(selectors, description)
     
     def _human_like_delay(self, min_delay=1, max_delay=3):
-        """Add human-like delay between actions."""
+        """Add human-like delay between actions when human-like mode is enabled."""
+        if not self.human_like:
+            return
         delay = random.uniform(min_delay, max_delay)
         time.sleep(delay)
     
-    def _type_naturally(self, element, text):
-        """Type text with natural human-like timing."""
+    def _type_naturally(self, element, text, human_like=None):
+        """Type text in one call, or char by char with human-like timing."""
+        if human_like is None:
+            human_like = self.stealth_typing
         element.clear()
-        for char in text:
+        if not human_like:
+            element.send_keys(text)
+            return
+        delays = [random.uniform(0.1, 0.3) for _ in text]
+        for char, delay in zip(text, delays):
             element.send_keys(char)
-            time.sleep(random.uniform(0.1, 0.3))
+            time.sleep(delay)
+    
+    def _prefetch(self, url):
+        """Start loading a page in a background tab configured like the scenario tab."""
+        try:
+            self.driver.switch_to.new_window("tab")
+            try:
+                # Blocking and stealth must be in place before the page starts loading
+                self._configure_tab()
+                handle = self.driver.current_window_handle
+                # Unlike driver.get, this returns as soon as the navigation has started
+                self.driver.execute_cdp_cmd("Page.navigate", {"url": url})
+                self.prefetched_windows[url] = handle
+            finally:
+                # Keep the scenario tab in front so its animation frames keep running
+                self.driver.switch_to.window(self.current_window)
+        except WebDriverException as e:
+            self.logger.warning("Could not prefetch %s: %s", url, e)
+    
+    def _switch_to_prefetched(self, url, link, expected_domain):
+        """Switch to a prefetched tab if the link on the page points to the expected domain."""
+        if url not in self.prefetched_windows:
+            return False
+        
+        href = self.driver.execute_script(
+            "const a = arguments[0].closest('a'); return a ? a.href : null;", link
+        )
+        if not href or expected_domain not in href:
+            return False
+        
+        try:
+            self._switch_to_window(self.prefetched_windows.pop(url))
+        except NoSuchWindowException:
+            self.logger.warning("Prefetched tab for %s is gone, clicking the link instead", expected_domain)
+            return False
+        
+        self.logger.info("Switched to prefetched tab for link: %s", href)
+        return True
     
     def step_1_open_google(self):
         """Step 1: Open Google Search page."""
         self.logger.info("=== Step 1: Opening Google Search ===")
         try:
             self.driver.get("https://www.google.com")
+            self._prefetch(LECTRA_URL)
+            page = self._probe(PAGE_STATE_JS)
 
             # Verify Google page loaded
-            self.assert_condition(
-                "google.com" in self.driver.current_url.lower(),
+            if not self.assert_condition(
+                "google.com" in page["url"].lower(),
                 "Google homepage URL verification"
-            )
+            ):
+                return False
             
             # Verify page title contains Google
-            self.assert_condition(
-                "google" in self.driver.title.lower(),
+            if not self.assert_condition(
+                "google" in page["title"].lower(),
                 "Google homepage title verification"
-            )
+            ):
+                return False
 
             return True
         except Exception as e:
-            self.logger.error(f"Failed to open Google: {str(e)}")
+            self.logger.error("Failed to open Google: %s", e)
             return False
     
     def step_2_handle_google_cookies(self):
         """Handle Google cookie consent if present."""
         self.logger.info("Checking for Google cookie consent...")
         
-        cookie_button = self.wait.until(EC.presence_of_element_located((By.ID, "L2AGLb")))
+        cookie_button = self._find_optional(SELECTORS["google_cookie"], "Google cookie consent")
         if cookie_button:
-            success = self._safe_click(cookie_button, "Google cookie consent")
+            success = self._click_and_await_removal(cookie_button, "Google cookie consent")
             if success:
-                    time.sleep(1)
-                    # Verify cookie banner is gone and search box is present
+                    # Verify search box is present once the cookie banner is gone
                     search_box = self.wait.until(EC.presence_of_element_located((By.NAME, "q")))
-                    self.assert_condition(
+                    if not self.assert_condition(
                         search_box is not None,
                         "Google search box presence verification and Google cookie banner removal verification"
-                    )
+                    ):
+                        return False
             return success 
         else:
             self.logger.info("No Google cookie consent found or already handled")
@@ -194,10 +766,11 @@ class LectraTestAutomation:
             search_box = self.wait.until(EC.presence_of_element_located((By.NAME, "q")))
 
             # Verify search box is interactable
-            self.assert_condition(
+            if not self.assert_condition(
                 search_box.is_enabled(),
                 "Search box interactability verification"
-            )
+            ):
+                return False
 
             self._type_naturally(search_box, "Lectra")
             self._human_like_delay(1, 2)
@@ -207,40 +780,44 @@ class LectraTestAutomation:
             self.wait.until(EC.presence_of_element_located((By.ID, "search")))
 
             # Verify URL shows search was performed
-            self.assert_condition(
-                "search?q=" in self.driver.current_url,
+            page = self._probe(PAGE_STATE_JS)
+            if not self.assert_condition(
+                "search?q=" in page["url"],
                 "Search URL verification"
-            )
+            ):
+                return False
             self.logger.info("Search completed successfully")
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to search for Lectra: {str(e)}")
+            self.logger.error("Failed to search for Lectra: %s", e)
             return False
     
     def step_4_click_lectra_website(self):
         """Step 3: Navigate to Lectra website from search results."""
         self.logger.info("=== Step 3: Navigating to Lectra website ===")
         
-        selectors = [
-            "//a[contains(@href, 'lectra.com')]//h3[@class='LC20lb MBeuO DKV0Md']",
-            "//h3[contains(text(), 'Lectra')]/parent::a",
-            "//a[contains(@href, 'lectra.com') and not(contains(@href, 'careers'))]"
-            
-        ]
+        lectra_link = self._find_element_by_selectors(SELECTORS["lectra_link"], "Lectra website link")
+        if not lectra_link:
+            return False
         
-        lectra_link = self._find_element_by_selectors(selectors, "Lectra website link")
-        if lectra_link and self._safe_click(lectra_link, "Lectra website link"):
+        # Reuse the tab preloaded in step 1; fall back to clicking the result
+        if self._switch_to_prefetched(LECTRA_URL, lectra_link, "lectra.com") or self._safe_click(lectra_link, "Lectra website link"):
             try:
                 self.wait.until(EC.url_contains("lectra"))
 
                 # Verify we're on Lectra domain
-                self.assert_condition(
-                    "lectra.com" in self.driver.current_url,
+                page = self._probe(PAGE_STATE_JS)
+                if not self.assert_condition(
+                    "lectra.com" in page["url"],
                     "Lectra website URL verification"
-                )
+                ):
+                    return False
 
-                self.logger.info(f"Successfully navigated to: {self.driver.current_url}")
+                self.logger.info("Successfully navigated to: %s", page['url'])
+                
+                # Careers only depends on this known URL, so start loading it now
+                self._prefetch(CAREERS_URL)
                 return True
             except TimeoutException:
                 self.logger.error("Failed to load Lectra website")
@@ -250,24 +827,16 @@ class LectraTestAutomation:
     def step_5_handle_lectra_cookies(self):
         """Step 4: Handle Lectra website cookies."""
         self.logger.info("=== Step 4: Handling Lectra cookies ===")
-        self._human_like_delay()
-        
-        selectors = [
-            "#ppms_cm_agree-to-all",
-            "//button[contains(text(), 'Accept all')]"
-        ]
         
-        cookie_button = self._find_element_by_selectors(selectors, "Lectra cookie consent")
+        cookie_button = self._find_optional(SELECTORS["lectra_cookie"], "Lectra cookie consent")
         if cookie_button:
-            success = self._safe_click(cookie_button, "Lectra cookie consent")
-            if success:
-                # Verify cookie disappeared
-                time.sleep(2)
-                cookie_elements = self.driver.find_elements(By.ID, "ppms_cm_agree-to-all")
-                self.assert_condition(
-                    len(cookie_elements) == 0,
-                    "Lectra cookie removal verification"
-                )
+            # Click and verify cookie disappeared in a single browser call
+            success = self._click_and_await_removal(cookie_button, "Lectra cookie consent")
+            if not self.assert_condition(
+                success,
+                "Lectra cookie removal verification"
+            ):
+                return False
             return success
         else:
             self.logger.info("No Lectra cookie consent found or already handled")
@@ -279,35 +848,27 @@ class LectraTestAutomation:
 
 
         # Click Languages button
-        language_selectors = [
-            '//*[@id="block-lectra-b5-languageswitcherinterfacetext-2"]/button',
-            '//button[contains(text(), "Languages")]',
-            "div[id='block-lectra-b5-languageswitcherinterfacetext-2'] button"
-        ]
-        
-        language_button = self._find_element_by_selectors(language_selectors, "Languages button")
+        language_button = self._find_element_by_selectors(SELECTORS["language_button"], "Languages button")
         if not language_button or not self._safe_click(language_button, "Languages button"):
             return False
         
         self._human_like_delay(0.5, 1.5)
         
         # Click English option
-        english_selectors = [
-            '//div[@id="block-lectra-b5-languageswitcherinterfacetext-2"]//a[normalize-space()="English"]',
-            '//a[@hreflang="en" and @href="/en" and contains(text(), "English") and @class="language-link"]'
-        ]
-        
-        english_link = self._find_element_by_selectors(english_selectors, "English language option")
+        english_link = self._find_element_by_selectors(SELECTORS["english_link"], "English language option")
         if english_link and self._safe_click(english_link, "English language"):
             self._human_like_delay()
+            self._wait_for_url("/en")
 
             # Verify language switch
-            self.assert_condition(
-                "/en" in self.driver.current_url or "/en/" in self.driver.current_url,
+            page = self._probe(PAGE_STATE_JS)
+            if not self.assert_condition(
+                "/en" in page["url"] or "/en/" in page["url"],
                 "English language URL verification"
-            )
+            ):
+                return False
 
-            self.logger.info(f"Language switched. Current URL: {self.driver.current_url}")
+            self.logger.info("Language switched. Current URL: %s", page['url'])
             return True
         return False
     
@@ -316,33 +877,27 @@ class LectraTestAutomation:
         self.logger.info("=== Step 6: Navigating Fashion menu ===")
         
         # Click Fashion button
-        fashion_selectors = [
-            '//button[contains(text(), "Fashion")]'
-        ]
-        
-        fashion_button = self._find_element_by_selectors(fashion_selectors, "Fashion button")
+        fashion_button = self._find_element_by_selectors(SELECTORS["fashion_button"], "Fashion button")
         if not fashion_button or not self._safe_click(fashion_button, "Fashion button"):
             return False
         
         self._human_like_delay()
         
         # Click Lectra & Fashion
-        lectra_fashion_selectors = [
-            '//a[normalize-space()="Lectra & Fashion"]',
-            '//a[@href="/en/fashion" and contains(text(), "Lectra & Fashion")]'
-        ]
-        
-        lectra_fashion_link = self._find_element_by_selectors(lectra_fashion_selectors, "Lectra & Fashion link")
+        lectra_fashion_link = self._find_element_by_selectors(SELECTORS["lectra_fashion_link"], "Lectra & Fashion link")
         if lectra_fashion_link and self._safe_click(lectra_fashion_link, "Lectra & Fashion"):
             self._human_like_delay()
+            self._wait_for_url("/fashion")
 
             # Verify navigation to fashion page
-            self.assert_condition(
-                "/fashion" in self.driver.current_url,
+            page = self._probe(PAGE_STATE_JS)
+            if not self.assert_condition(
+                "/fashion" in page["url"],
                 "Fashion page URL verification"
-            )
+            ):
+                return False
 
-            self.logger.info(f"Navigated to Fashion page: {self.driver.current_url}")
+            self.logger.info("Navigated to Fashion page: %s", page['url'])
             return True
         return False
     
@@ -351,24 +906,14 @@ class LectraTestAutomation:
         self.logger.info("=== Step 7: Clicking Automotive and Furniture tabs ===")
         
         # Click Automotive
-        automotive_selectors = [
-            '//button[contains(text(), "Automotive")]',
-            '//*[@id="block-lectra-b5-mainnavigation"]/ul/li[2]/button'
-        ]
-        
-        automotive_button = self._find_element_by_selectors(automotive_selectors, "Automotive button")
+        automotive_button = self._find_element_by_selectors(SELECTORS["automotive_tab"], "Automotive button")
         if automotive_button:
             self._safe_click(automotive_button, "Automotive tab")
         
         self._human_like_delay(0.3, 0.8)
         
         # Click Furniture
-        furniture_selectors = [
-            '//button[contains(text(), "Furniture")]',
-            '//*[@id="block-lectra-b5-mainnavigation"]/ul/li[3]/button'
-        ]
-        
-        furniture_button = self._find_element_by_selectors(furniture_selectors, "Furniture button")
+        furniture_button = self._find_element_by_selectors(SELECTORS["furniture_tab"], "Furniture button")
         if furniture_button:
             self._safe_click(furniture_button, "Furniture tab")
         
@@ -380,35 +925,27 @@ class LectraTestAutomation:
         self.logger.info("=== Step 8: Navigating About Us menu ===")
         
         # Click About Us
-        about_selectors = [
-            '//div[@id="block-lectra-b5-headernavigation"]//button[@type="button"][normalize-space()="About us"]',
-            'button[class="nav-link dropdown-toggle ext-highlight"]'
-        ]
-        
-        about_button = self._find_element_by_selectors(about_selectors, "About us button")
+        about_button = self._find_element_by_selectors(SELECTORS["about_us_button"], "About us button")
         if not about_button or not self._safe_click(about_button, "About us button"):
             return False
         
         self._human_like_delay()
         
         # Click Discover Lectra
-        discover_selectors = [
-            '//div[@id="block-lectra-b5-headernavigation"]//ul//a[@class="nav-link"][normalize-space()="Discover Lectra"]',
-            'div[id="block-lectra-b5-headernavigation"] ul a[class="nav-link ext-highlight"]',
-            '//a[@href="/en/discover-lectra" and contains(text(), "Discover Lectra")]'
-        ]
-        
-        discover_link = self._find_element_by_selectors(discover_selectors, "Discover Lectra link")
+        discover_link = self._find_element_by_selectors(SELECTORS["discover_lectra_link"], "Discover Lectra link")
         if discover_link and self._safe_click(discover_link, "Discover Lectra"):
             self._human_like_delay()
+            self._wait_for_url("/discover-lectra")
 
             # Verify navigation to Discover Lectra page
-            self.assert_condition(
-                "/discover-lectra" in self.driver.current_url,
+            page = self._probe(PAGE_STATE_JS)
+            if not self.assert_condition(
+                "/discover-lectra" in page["url"],
                 "Discover Lectra page URL verification"
-            )
+            ):
+                return False
 
-            self.logger.info(f"Navigated to Discover Lectra: {self.driver.current_url}")
+            self.logger.info("Navigated to Discover Lectra: %s", page['url'])
             return True
         return False
     
@@ -416,42 +953,36 @@ class LectraTestAutomation:
         """Step 9: Navigate to careers through View job openings."""
         self.logger.info("=== Step 9: Navigating to careers ===")
         
-        # Scroll to find View job openings
-        self.logger.info("Scrolling to find 'View job openings' button")
-        for i in range(8):
-            self.driver.execute_script("window.scrollBy(0, 1000);")
-            self._human_like_delay(0.5, 1)
-        
-        view_job_selectors = [
-            '//*[@id="block-lectra-b5-content"]//a[contains(text(), "View job openings")]',
-            'div[class="background--greige layout layout--onecol"] a[class="gtm-cta"]'
-        ]
-        
-        view_job_button = self._find_element_by_selectors(view_job_selectors, "View job openings button")
+        # Scroll straight to View job openings
+        self.logger.info("Scrolling to 'View job openings' button")
+        view_job_button = self._scroll_to_element(SELECTORS["view_job_openings"], "View job openings button")
         if not view_job_button or not self._safe_click(view_job_button, "View job openings"):
             return False
         
-        self._human_like_delay()
+        # The JS click returns before the navigation commits; wait for the Discover Lectra
+        # document to go so the next lookup does not run against the outgoing page
+        try:
+            self.wait.until(EC.staleness_of(view_job_button))
+        except TimeoutException:
+            self.logger.error("View job openings did not navigate away from Discover Lectra")
+            return False
         
         # Navigate to job opportunities
         return self._navigate_to_job_opportunities()
     
     def _navigate_to_job_opportunities(self):
         """Navigate to job opportunities page."""
-        # Scroll to find Our job opportunities
-        for i in range(2):
-            self.driver.execute_script("window.scrollBy(0, 500);")
-            self._human_like_delay(0.5, 1)
-        
-        job_opp_selectors = [
-            '//a[@href="https://careers.lectra.com/" and contains(@class, "gtm-cta")]',
-            '//a[contains(text(), "Our job opportunities")]'
-        ]
+        self.original_window = self.current_window
+        self.handles_before_click = set(self.driver.window_handles)
         
-        self.original_window = self.driver.current_window_handle
+        job_opp_link = self._scroll_to_element(SELECTORS["job_opportunities_link"], "Our job opportunities link")
+        if not job_opp_link:
+            return False
         
-        job_opp_link = self._find_element_by_selectors(job_opp_selectors, "Our job opportunities link")
-        if not job_opp_link or not self._safe_click(job_opp_link, "Our job opportunities"):
+        # Reuse the careers tab preloaded on reaching Lectra; fall back to clicking the link
+        if self._switch_to_prefetched(CAREERS_URL, job_opp_link, "careers.lectra.com"):
+            return self._wait_for_careers_page()
+        if not self._safe_click(job_opp_link, "Our job opportunities"):
             return False
         
         # Handle potential new tab
@@ -460,13 +991,20 @@ class LectraTestAutomation:
     
     def switch_to_careers_tab(self):
         """Switch to careers tab if opened in new window."""
-        all_windows = self.driver.window_handles
-        if len(all_windows) > 1:
-            for window in all_windows:
-                if window != self.original_window:
-                    self.driver.switch_to.window(window)
-                    break
+        try:
+            new_handles = self.short_wait.until(
+                lambda d: set(d.window_handles) - self.handles_before_click
+            )
+            self._switch_to_window(new_handles.pop())
+            # DevTools settings are per tab, so re-apply them to the new one
+            self._configure_tab()
+        except TimeoutException:
+            self.logger.info("No new tab opened, staying in current tab")
         
+        return self._wait_for_careers_page()
+    
+    def _wait_for_careers_page(self):
+        """Wait until the current tab shows the careers site."""
         try:
             self.wait.until(EC.url_contains("careers.lectra.com"))
             self.logger.info("Successfully navigated to careers page")
@@ -479,14 +1017,9 @@ class LectraTestAutomation:
         """Handle cookies on career page."""
         self.logger.info("=== Step 10: Handling career page cookies ===")
         
-        career_cookie_selectors = [
-            '#cookie-accept',
-            '//button[@id="cookie-accept"]'
-        ]
-        
-        cookie_button = self._find_element_by_selectors(career_cookie_selectors, "Career cookie button")
+        cookie_button = self._find_optional(SELECTORS["career_cookie"], "Career cookie button")
         if cookie_button:
-            return self._safe_click(cookie_button, "Career cookie consent")
+            return self._click_and_await_removal(cookie_button, "Career cookie consent")
         else:
             self.logger.info("No career cookie consent found")
             return True
@@ -496,60 +1029,57 @@ class LectraTestAutomation:
         self.logger.info("=== Step 11: Searching jobs and clicking first opportunity ===")
         
         # Click Search jobs
-        search_selectors = [
-            '//*[@class="search displayDT"]//input[@type="submit" and @class="btn keywordsearch-button" and @value="Search jobs"]',
-            '//*[@id="search-wrapper"]/div/form/div/div/div[2]/div[2]/div[1]/input'
-        ]
-        
-        search_button = self._find_element_by_selectors(search_selectors, "Search jobs button")
+        search_button = self._find_element_by_selectors(SELECTORS["search_jobs_button"], "Search jobs button")
         if not search_button or not self._safe_click(search_button, "Search jobs"):
             return False
         
         # Wait for results and click first job
         try:
             self.wait.until(EC.presence_of_element_located((By.ID, "searchresults")))
-            self._human_like_delay()
 
             # Verify results contain job listings
-            job_rows = self.driver.find_elements(By.XPATH, '//table[@id="searchresults"]//tbody/tr')
-            self.assert_condition(
-                len(job_rows) > 0,
-                "Job listings presence verification"
+            row_count = self.driver.execute_script(
+                "return document.querySelectorAll('#searchresults tbody tr').length;"
             )
+            if not self.assert_condition(
+                row_count > 0,
+                "Job listings presence verification"
+            ):
+                return False
             
-            first_job_selectors = [
-                '(//*[@class="jobTitle-link"])[1]',
-                '//table[@id="searchresults"]//tbody/tr[1]/td[@class="colTitle"]'
-            ]
-            
-            first_job = self._find_element_by_selectors(first_job_selectors, "First job opportunity")
+            first_job = self._find_element_by_selectors(SELECTORS["first_job"], "First job opportunity")
             if first_job and self._safe_click(first_job, "First job opportunity"):
                 self._human_like_delay()
+                self._wait_for_url("job")
                 
                 # Verify job details URL contains job identifier
-                self.assert_condition(
-                    "job" in self.driver.current_url,
+                page = self._probe(PAGE_STATE_JS)
+                if not self.assert_condition(
+                    "job" in page["url"],
                     "Job details URL verification"
-                )
+                ):
+                    return False
                 
                 # Close job details tab and return to original
                 self._human_like_delay()
                 self.logger.info("Closing job details tab...")
                 self.driver.close()
-                self.driver.switch_to.window(self.original_window)
+                self._switch_to_window(self.original_window)
 
                 # Verify return to original window
-                self.assert_condition(
-                    "careers.lectra.com" not in self.driver.current_url,
+                page = self._probe(PAGE_STATE_JS)
+                if not self.assert_condition(
+                    "careers.lectra.com" not in page["url"],
                     "Return to original tab verification"
-                )
+                ):
+                    return False
 
                 self.logger.info("Returned to original tab")
                 
                 return True
                 
         except Exception as e:
-            self.logger.error(f"Error in job search: {str(e)}")
+            self.logger.error("Error in job search: %s", e)
         
         return False
     
@@ -558,44 +1088,83 @@ class LectraTestAutomation:
         self.logger.info("Starting Lectra website automation scenario")
         
         steps = [
-            ("Open Google", self.step_1_open_google),
-            ("Handle Google Cookies", self.step_2_handle_google_cookies),
-            ("Search for Lectra", self.step_3_search_lectra),
-            ("Navigate to Lectra Website", self.step_4_click_lectra_website),
-            ("Handle Lectra Cookies", self.step_5_handle_lectra_cookies),
-            ("Switch to English", self.step_6_switch_to_english),
-            ("Navigate Fashion Menu", self.step_7_navigate_fashion_menu),
-            ("Click Automotive & Furniture", self.step_8_click_automotive_furniture),
-            ("Navigate About Us", self.step_9_navigate_about_us),
-            ("Navigate to Careers", self.step_10_navigate_to_careers),
-            ("Handle Career Cookies", self.step_11_handle_career_cookies),
-            ("Search Jobs & Click First", self.step_12_search_and_click_first_job)
+            Step("Open Google", self.step_1_open_google,
+                 postcondition=GOOGLE_SEARCH_BOX),
+            Step("Handle Google Cookies", self.step_2_handle_google_cookies,
+                 precondition=GOOGLE_SEARCH_BOX, postcondition=GOOGLE_SEARCH_BOX),
+            Step("Search for Lectra", self.step_3_search_lectra,
+                 precondition=GOOGLE_SEARCH_BOX, postcondition=GOOGLE_RESULTS),
+            Step("Navigate to Lectra Website", self.step_4_click_lectra_website,
+                 precondition=GOOGLE_RESULTS, postcondition=LECTRA_LANGUAGE_SWITCHER),
+            Step("Handle Lectra Cookies", self.step_5_handle_lectra_cookies),
+            Step("Switch to English", self.step_6_switch_to_english,
+                 precondition=LECTRA_LANGUAGE_SWITCHER, postcondition=LECTRA_MAIN_NAVIGATION),
+            Step("Navigate Fashion Menu", self.step_7_navigate_fashion_menu,
+                 precondition=LECTRA_MAIN_NAVIGATION, postcondition=LECTRA_MAIN_NAVIGATION),
+            Step("Click Automotive & Furniture", self.step_8_click_automotive_furniture,
+                 precondition=LECTRA_MAIN_NAVIGATION),
+            Step("Navigate About Us", self.step_9_navigate_about_us,
+                 precondition=LECTRA_HEADER_NAVIGATION, postcondition=LECTRA_CONTENT),
+            Step("Navigate to Careers", self.step_10_navigate_to_careers,
+                 precondition=LECTRA_CONTENT),
+            Step("Handle Career Cookies", self.step_11_handle_career_cookies),
+            Step("Search Jobs & Click First", self.step_12_search_and_click_first_job,
+                 precondition=CAREERS_SEARCH_FORM)
         ]
         
         results = {}
-        for step_name, step_function in steps:
+        # Landmark confirmed by the previous step; a matching precondition needs no second wait
+        confirmed = None
+        for step in steps:
             try:
-                self.logger.info(f"Executing: {step_name}")
-                result = step_function()
-                results[step_name] = result
+                self.logger.info("Executing: %s", step.name)
+                if step.precondition and step.precondition != confirmed:
+                    self.wait.until(EC.presence_of_element_located(step.precondition))
+                
+                result = step.action()
+                if result and step.postcondition:
+                    self.wait.until(EC.presence_of_element_located(step.postcondition))
+                confirmed = step.postcondition if result else None
+                results[step.name] = result
                 
                 if not result:
-                    self.logger.warning(f"Step '{step_name}' failed, but continuing...")
+                    self.logger.warning("Step '%s' failed, but continuing...", step.name)
                 else:
-                    self.logger.info(f"Step '{step_name}' completed successfully")
+                    self.logger.info("Step '%s' completed successfully", step.name)
                     
             except Exception as e:
-                self.logger.error(f"Step '{step_name}' encountered error: {str(e)}")
-                results[step_name] = False
+                self.logger.error("Step '%s' encountered error: %s", step.name, e)
+                results[step.name] = False
+                confirmed = None
         
         # Print summary
         self.logger.info("=== EXECUTION SUMMARY ===")
-        for step, result in results.items():
+        for step_name, result in results.items():
             status = "✓ PASSED" if result else "✗ FAILED"
-            self.logger.info(f"{step}: {status}")
+            self.logger.info("%s: %s", step_name, status)
         
         return results
     
+    def reset(self):
+        """Close every tab but the startup one and clear per-scenario state for another scenario.
+
+        Only meant for browsers this instance launched; an attached browser may hold other clients' tabs.
+        """
+        for handle in self.driver.window_handles:
+            if handle != self.initial_window:
+                self._switch_to_window(handle)
+                self.driver.close()
+        self._switch_to_window(self.initial_window)
+        self.original_window = None
+        self.handles_before_click = set()
+        self.prefetched_windows = {}
+    
+    def quit(self):
+        """Close the browser and end the WebDriver session."""
+        if self.driver:
+            self.driver.quit()
+            self.driver = None
+    
     def cleanup(self):
         """Clean up resources."""
         if self.driver:
@@ -604,10 +1173,116 @@ class LectraTestAutomation:
             # self.driver.quit()
 
 
+class BrowserPool:
+    """
+    Bounded pool of LectraTestAutomation instances shared by concurrent scenarios.
+    Each browser is recycled after max_uses scenarios.
+    """
+    
+    def __init__(self, max_size=4, max_uses=10, **automation_kwargs):
+        """Configure the pool; browsers are started lazily by acquire()."""
+        # reset() closes every other tab, which would hit other clients of a shared browser
+        if automation_kwargs.get("debugger_address"):
+            raise ValueError("BrowserPool launches its own browsers and cannot use debugger_address")
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.automation_kwargs = automation_kwargs
+        # Idle instances, most recently released last; guarded by _available together
+        # with the use counts, the ids of checked-out instances and the slot count
+        self._idle = []
+        self._uses = {}
+        self._checked_out = set()
+        self._size = 0
+        self._available = threading.Condition()
+    
+    def acquire(self, timeout=None):
+        """Return an idle instance, starting a new browser while below max_size.
+
+        Raises TimeoutError if no instance or free slot turns up within timeout seconds.
+        """
+        with self._available:
+            if not self._available.wait_for(lambda: self._idle or self._size < self.max_size, timeout):
+                raise TimeoutError(f"No browser became available within {timeout}s")
+            if self._idle:
+                instance = self._idle.pop()
+                self._checked_out.add(id(instance))
+                return instance
+            self._size += 1
+        
+        try:
+            instance = LectraTestAutomation(**self.automation_kwargs)
+        except Exception:
+            self._free_slot()
+            raise
+        with self._available:
+            self._uses[id(instance)] = 0
+            self._checked_out.add(id(instance))
+        return instance
+    
+    def release(self, instance):
+        """Return an instance to the pool, or quit it once it has been used max_uses times.
+
+        Raises ValueError for an instance that is not currently checked out from this pool.
+        """
+        with self._available:
+            if id(instance) not in self._checked_out:
+                raise ValueError("Instance is not checked out from this pool")
+            self._checked_out.discard(id(instance))
+            uses = self._uses[id(instance)] + 1
+            self._uses[id(instance)] = uses
+        
+        if uses >= self.max_uses:
+            self._discard(instance)
+            return
+        try:
+            instance.reset()
+        except WebDriverException:
+            self._discard(instance)
+            return
+        except Exception:
+            # Not a browser failure, so surface it, but never leak the slot
+            self._discard(instance)
+            raise
+        with self._available:
+            self._idle.append(instance)
+            self._available.notify()
+    
+    def _free_slot(self):
+        """Give up a browser slot and wake a waiter that can now start a new browser."""
+        with self._available:
+            self._size -= 1
+            self._available.notify()
+    
+    def _discard(self, instance):
+        """Quit an instance and free its slot."""
+        with self._available:
+            self._uses.pop(id(instance), None)
+        try:
+            instance.quit()
+        finally:
+            # Only after the old browser is gone, so max_size bounds live browsers
+            self._free_slot()
+    
+    def close(self):
+        """Quit every idle browser in the pool."""
+        with self._available:
+            idle, self._idle = self._idle, []
+        for instance in idle:
+            self._discard(instance)
+
+
 def main():
     """Main execution function."""
+    parser = argparse.ArgumentParser(description="Run the Lectra website automation scenario.")
+    parser.add_argument("--debug", action="store_true", help="show the browser window instead of running headless")
+    parser.add_argument("--log-level", choices=["DEBUG", "INFO", "WARNING", "ERROR"], default="INFO",
+                        help="logging level for the scenario run (default: INFO)")
+    parser.add_argument("--driver-path", help="use this chromedriver instead of resolving one with Selenium Manager")
+    args = parser.parse_args()
+    
     # Initialize and run the test
-    test_automation = LectraTestAutomation(headless=False, timeout=10)
+    test_automation = LectraTestAutomation(headless=not args.debug, timeout=10, driver_path=args.driver_path,
+                                           log_level=args.log_level)
     
     try:
         results = test_automation.run_complete_scenario()
@@ -619,7 +1294,11 @@ def main():
     except Exception as e:
         print(f"Test failed with error: {str(e)}")
     finally:
-        test_automation.cleanup()
+        # Only a visible browser is worth leaving open for review
+        if args.debug:
+            test_automation.cleanup()
+        else:
+            test_automation.quit()
 
 
 if __name__ == "__main__":
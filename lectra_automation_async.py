@@ -0,0 +1,385 @@
+import argparse
+import asyncio
+import functools
+import logging
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+from selenium.webdriver.common.by import By
+
+from lectra_automation import BLOCKED_URL_PATTERNS, SELECTORS, STEALTH_JS, instance_logger
+
+
+# Playwright resource types matching the sync driver's RESOURCE_URL_PATTERNS
+RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+# How long a pointer click may wait for actionability before the DOM click fallback
+CLICK_TIMEOUT_MS = 2000
+
+
+class _ClickFailed(Exception):
+    """Raised inside an expect_page block to abandon the new-page wait."""
+
+
+def _to_playwright_selector(by, selector):
+    """Translate a Selenium (By, selector) pair into a Playwright selector string."""
+    if by == By.XPATH:
+        return f"xpath={selector}"
+    if by == By.ID:
+        return f"id={selector}"
+    if by == By.NAME:
+        return f'css=[name="{selector}"]'
+    return f"css={selector}"
+
+
+@functools.lru_cache(maxsize=None)
+def _playwright_selectors(selectors):
+    """Translate a tuple of (By, selector) candidates once per distinct tuple."""
+    return tuple(_to_playwright_selector(by, selector) for by, selector in selectors)
+
+
+class LectraTestAutomationAsync:
+    """
+    Opt-in asyncio variant of LectraTestAutomation built on Playwright's async API.
+    Independent reads within a step are issued concurrently with asyncio.gather.
+    """
+
+    def __init__(self, headless=True, timeout=10, log_level=None, block_resources=True):
+        """Store options; the browser is launched by start()."""
+        self.headless = headless
+        self.blocked_resource_types = RESOURCE_TYPES if block_resources else frozenset()
+        self.timeout_ms = timeout * 1000
+        self.playwright = None
+        self.browser = None
+        self.context = None
+        self.page = None
+        self.original_page = None
+
+        if log_level is None:
+            log_level = logging.WARNING if headless else logging.INFO
+        self.logger = instance_logger(self, log_level)
+
+    async def start(self):
+        """Launch Chromium and open the first page."""
+        self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(
+            headless=self.headless,
+            args=["--disable-blink-features=AutomationControlled"]
+        )
+        self.context = await self.browser.new_context()
+        self.context.set_default_timeout(self.timeout_ms)
+
+        # Same request filtering as the Selenium driver: no trackers, and no
+        # images, fonts or media unless block_resources=False
+        blocked = [pattern.strip("*") for pattern in BLOCKED_URL_PATTERNS]
+
+        async def filter_requests(route):
+            request = route.request
+            if (request.resource_type in self.blocked_resource_types
+                    or any(part in request.url for part in blocked)):
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await self.context.route("**/*", filter_requests)
+        await self.context.add_init_script(STEALTH_JS)
+        self.page = await self.context.new_page()
+        self.logger.info("Chromium browser initialized successfully")
+
+    def assert_condition(self, condition, message):
+        """Custom assertion with logging. Returns whether the condition held."""
+        if condition:
+            self.logger.info("✓ ASSERTION PASSED: %s", message)
+            return True
+        self.logger.error("✗ ASSERTION FAILED: %s", message)
+        return False
+
+    async def _find_element_by_selectors(self, selectors, description="element", timeout_ms=None):
+        """Wait for a visible element, trying the (By, selector) candidates in list order on each poll."""
+        candidates = [self.page.locator(selector).first for selector in _playwright_selectors(tuple(selectors))]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + (timeout_ms or self.timeout_ms) / 1000
+        while True:
+            # Earlier candidates win even if a later, more generic one appears first in the DOM
+            for locator in candidates:
+                if await locator.is_visible():
+                    self.logger.info("Found %s", description)
+                    return locator
+            if loop.time() >= deadline:
+                self.logger.warning("Could not find %s with any provided selectors", description)
+                return None
+            await asyncio.sleep(0.1)
+
+    async def _safe_click(self, locator, description="element"):
+        """Click an element, falling back to a DOM click if the pointer click is intercepted."""
+        try:
+            await locator.click(timeout=CLICK_TIMEOUT_MS)
+        except PlaywrightTimeoutError:
+            self.logger.warning("Click intercepted for %s, retrying with JavaScript...", description)
+            try:
+                await locator.evaluate("el => el.click()")
+            except Exception as e:
+                self.logger.error("Failed to click %s: %s", description, e)
+                return False
+        self.logger.info("Successfully clicked %s", description)
+        return True
+
+    async def _accept_optional_cookies(self, selectors, description):
+        """Accept a cookie banner if it shows up within a short timeout."""
+        cookie_button = await self._find_element_by_selectors(selectors, description, timeout_ms=2000)
+        if not cookie_button:
+            self.logger.info("No %s found or already handled", description)
+            return True
+        if not await self._safe_click(cookie_button, description):
+            return False
+        try:
+            await cookie_button.wait_for(state="hidden", timeout=3000)
+            return self.assert_condition(True, f"{description} removal verification")
+        except PlaywrightTimeoutError:
+            return self.assert_condition(False, f"{description} removal verification")
+
+    async def step_1_open_google(self):
+        """Step 1: Open Google Search page."""
+        self.logger.info("=== Step 1: Opening Google Search ===")
+        await self.page.goto("https://www.google.com", wait_until="domcontentloaded")
+
+        url, title = await asyncio.gather(
+            self.page.evaluate("location.href"),
+            self.page.title()
+        )
+        return (
+            self.assert_condition("google.com" in url.lower(), "Google homepage URL verification")
+            and self.assert_condition("google" in title.lower(), "Google homepage title verification")
+        )
+
+    async def step_2_handle_google_cookies(self):
+        """Handle Google cookie consent if present."""
+        self.logger.info("Checking for Google cookie consent...")
+        return await self._accept_optional_cookies(SELECTORS["google_cookie"], "Google cookie consent")
+
+    async def step_3_search_lectra(self):
+        """Step 2: Search for 'Lectra'."""
+        self.logger.info("=== Step 2: Searching for Lectra ===")
+        search_box = self.page.locator('[name="q"]').first
+        if not self.assert_condition(await search_box.is_enabled(), "Search box interactability verification"):
+            return False
+
+        await search_box.fill("Lectra")
+        await search_box.press("Enter")
+        await self.page.locator("#search").wait_for()
+        return self.assert_condition("search?q=" in self.page.url, "Search URL verification")
+
+    async def step_4_click_lectra_website(self):
+        """Step 3: Navigate to Lectra website from search results."""
+        self.logger.info("=== Step 3: Navigating to Lectra website ===")
+        lectra_link = await self._find_element_by_selectors(SELECTORS["lectra_link"], "Lectra website link")
+        if not lectra_link or not await self._safe_click(lectra_link, "Lectra website link"):
+            return False
+
+        try:
+            await self.page.wait_for_url("**lectra.com**", wait_until="domcontentloaded")
+        except PlaywrightTimeoutError:
+            self.logger.error("Failed to load Lectra website")
+            return False
+        return self.assert_condition("lectra.com" in self.page.url, "Lectra website URL verification")
+
+    async def step_5_handle_lectra_cookies(self):
+        """Step 4: Handle Lectra website cookies."""
+        self.logger.info("=== Step 4: Handling Lectra cookies ===")
+        return await self._accept_optional_cookies(SELECTORS["lectra_cookie"], "Lectra cookie consent")
+
+    async def _click_menu(self, button_selectors, button_description, link_selectors, link_description, url_fragment):
+        """Open a menu, follow one of its links and verify the resulting URL."""
+        button = await self._find_element_by_selectors(button_selectors, button_description)
+        if not button or not await self._safe_click(button, button_description):
+            return False
+
+        link = await self._find_element_by_selectors(link_selectors, link_description)
+        if not link or not await self._safe_click(link, link_description):
+            return False
+
+        try:
+            await self.page.wait_for_url(f"**{url_fragment}**", wait_until="domcontentloaded")
+        except PlaywrightTimeoutError:
+            pass
+        return self.assert_condition(url_fragment in self.page.url, f"{link_description} URL verification")
+
+    async def step_6_switch_to_english(self):
+        """Step 5: Switch language to English."""
+        self.logger.info("=== Step 5: Switching to English ===")
+        return await self._click_menu(
+            SELECTORS["language_button"], "Languages button", SELECTORS["english_link"], "English language", "/en"
+        )
+
+    async def step_7_navigate_fashion_menu(self):
+        """Step 6: Navigate Fashion -> Lectra & Fashion."""
+        self.logger.info("=== Step 6: Navigating Fashion menu ===")
+        return await self._click_menu(
+            SELECTORS["fashion_button"], "Fashion button", SELECTORS["lectra_fashion_link"], "Lectra & Fashion", "/fashion"
+        )
+
+    async def step_8_click_automotive_furniture(self):
+        """Step 7: Click Automotive and Furniture tabs."""
+        self.logger.info("=== Step 7: Clicking Automotive and Furniture tabs ===")
+        for selectors, description in ((SELECTORS["automotive_tab"], "Automotive tab"), (SELECTORS["furniture_tab"], "Furniture tab")):
+            tab = await self._find_element_by_selectors(selectors, description)
+            if tab:
+                await self._safe_click(tab, description)
+        return True
+
+    async def step_9_navigate_about_us(self):
+        """Step 8: Navigate About Us -> Discover Lectra."""
+        self.logger.info("=== Step 8: Navigating About Us menu ===")
+        return await self._click_menu(
+            SELECTORS["about_us_button"], "About us button", SELECTORS["discover_lectra_link"], "Discover Lectra", "/discover-lectra"
+        )
+
+    async def step_10_navigate_to_careers(self):
+        """Step 9: Navigate to careers through View job openings."""
+        self.logger.info("=== Step 9: Navigating to careers ===")
+        view_job_button = await self._find_element_by_selectors(SELECTORS["view_job_openings"], "View job openings button")
+        if not view_job_button or not await self._safe_click(view_job_button, "View job openings"):
+            return False
+
+        job_opp_link = await self._find_element_by_selectors(SELECTORS["job_opportunities_link"], "Our job opportunities link")
+        if not job_opp_link:
+            return False
+
+        self.original_page = self.page
+        try:
+            async with self.context.expect_page(timeout=2000) as new_page_info:
+                if not await self._safe_click(job_opp_link, "Our job opportunities"):
+                    # Leaving by exception cancels the new-page wait instead of sitting it out
+                    raise _ClickFailed
+            self.page = await new_page_info.value
+        except _ClickFailed:
+            return False
+        except PlaywrightTimeoutError:
+            # Link opened in the same tab
+            pass
+
+        try:
+            await self.page.wait_for_url("**careers.lectra.com**", wait_until="domcontentloaded")
+            self.logger.info("Successfully navigated to careers page")
+            return True
+        except PlaywrightTimeoutError:
+            self.logger.error("Failed to load careers page")
+            return False
+
+    async def step_11_handle_career_cookies(self):
+        """Handle cookies on career page."""
+        self.logger.info("=== Step 10: Handling career page cookies ===")
+        return await self._accept_optional_cookies(SELECTORS["career_cookie"], "Career cookie consent")
+
+    async def step_12_search_and_click_first_job(self):
+        """Step 11: Search jobs and click first opportunity."""
+        self.logger.info("=== Step 11: Searching jobs and clicking first opportunity ===")
+        search_button = await self._find_element_by_selectors(SELECTORS["search_jobs_button"], "Search jobs button")
+        if not search_button or not await self._safe_click(search_button, "Search jobs"):
+            return False
+
+        await self.page.locator("#searchresults").wait_for(state="attached")
+        row_count, first_job = await asyncio.gather(
+            self.page.locator("#searchresults tbody tr").count(),
+            self._find_element_by_selectors(SELECTORS["first_job"], "First job opportunity")
+        )
+        if not self.assert_condition(row_count > 0, "Job listings presence verification"):
+            return False
+        if not first_job or not await self._safe_click(first_job, "First job opportunity"):
+            return False
+
+        try:
+            await self.page.wait_for_url("**job**", wait_until="domcontentloaded")
+        except PlaywrightTimeoutError:
+            pass
+        if not self.assert_condition("job" in self.page.url, "Job details URL verification"):
+            return False
+
+        self.logger.info("Closing job details tab...")
+        await self.page.close()
+        self.page = self.original_page
+        await self.page.bring_to_front()
+        if not self.assert_condition(
+            "careers.lectra.com" not in self.page.url,
+            "Return to original tab verification"
+        ):
+            return False
+
+        self.logger.info("Returned to original tab")
+        return True
+
+    async def run_complete_scenario(self):
+        """Execute the complete test scenario."""
+        self.logger.info("Starting Lectra website automation scenario (async)")
+
+        steps = [
+            ("Open Google", self.step_1_open_google),
+            ("Handle Google Cookies", self.step_2_handle_google_cookies),
+            ("Search for Lectra", self.step_3_search_lectra),
+            ("Navigate to Lectra Website", self.step_4_click_lectra_website),
+            ("Handle Lectra Cookies", self.step_5_handle_lectra_cookies),
+            ("Switch to English", self.step_6_switch_to_english),
+            ("Navigate Fashion Menu", self.step_7_navigate_fashion_menu),
+            ("Click Automotive & Furniture", self.step_8_click_automotive_furniture),
+            ("Navigate About Us", self.step_9_navigate_about_us),
+            ("Navigate to Careers", self.step_10_navigate_to_careers),
+            ("Handle Career Cookies", self.step_11_handle_career_cookies),
+            ("Search Jobs & Click First", self.step_12_search_and_click_first_job)
+        ]
+
+        results = {}
+        for step_name, step_function in steps:
+            try:
+                self.logger.info("Executing: %s", step_name)
+                result = await step_function()
+                results[step_name] = result
+
+                if not result:
+                    self.logger.warning("Step '%s' failed, but continuing...", step_name)
+                else:
+                    self.logger.info("Step '%s' completed successfully", step_name)
+
+            except Exception as e:
+                self.logger.error("Step '%s' encountered error: %s", step_name, e)
+                results[step_name] = False
+
+        # Print summary
+        self.logger.info("=== EXECUTION SUMMARY ===")
+        for step_name, result in results.items():
+            status = "✓ PASSED" if result else "✗ FAILED"
+            self.logger.info("%s: %s", step_name, status)
+
+        return results
+
+    async def cleanup(self):
+        """Close the browser and stop Playwright."""
+        if self.browser:
+            await self.browser.close()
+        if self.playwright:
+            await self.playwright.stop()
+
+
+async def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Run the Lectra website automation scenario with Playwright.")
+    parser.add_argument("--debug", action="store_true", help="show the browser window instead of running headless")
+    args = parser.parse_args()
+
+    # INFO keeps the step summary visible even when headless
+    test_automation = LectraTestAutomationAsync(headless=not args.debug, timeout=10, log_level=logging.INFO)
+
+    try:
+        await test_automation.start()
+        results = await test_automation.run_complete_scenario()
+        print("\nTest execution completed. Check logs for details.")
+        return results
+
+    except Exception as e:
+        print(f"Test failed with error: {str(e)}")
+    finally:
+        await test_automation.cleanup()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\nTest interrupted by user")
@@ -0,0 +1,112 @@
+import threading
+import unittest
+from unittest import mock
+
+from selenium.common.exceptions import WebDriverException
+
+import lectra_automation
+from lectra_automation import BrowserPool
+
+
+class FakeAutomation:
+    """Stands in for LectraTestAutomation without starting a browser."""
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.reset_calls = 0
+        self.quit_calls = 0
+        self.reset_error = None
+
+    def reset(self):
+        self.reset_calls += 1
+        if self.reset_error:
+            raise self.reset_error
+
+    def quit(self):
+        self.quit_calls += 1
+
+
+class BrowserPoolTest(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(lectra_automation, "LectraTestAutomation", FakeAutomation)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_acquire_starts_browsers_with_the_pool_options(self):
+        pool = BrowserPool(max_size=2, headless=True)
+        first, second = pool.acquire(), pool.acquire()
+        self.assertIsNot(first, second)
+        self.assertEqual(first.kwargs, {"headless": True})
+
+    def test_released_instance_is_reset_and_reused(self):
+        pool = BrowserPool(max_size=1)
+        instance = pool.acquire()
+        pool.release(instance)
+        self.assertEqual(instance.reset_calls, 1)
+        self.assertIs(pool.acquire(), instance)
+
+    def test_double_release_is_rejected(self):
+        pool = BrowserPool(max_size=2)
+        instance = pool.acquire()
+        pool.release(instance)
+        with self.assertRaises(ValueError):
+            pool.release(instance)
+        self.assertIs(pool.acquire(), instance)
+        self.assertIsNot(pool.acquire(), instance)
+
+    def test_foreign_instance_is_rejected(self):
+        pool = BrowserPool(max_size=1)
+        with self.assertRaises(ValueError):
+            pool.release(FakeAutomation())
+
+    def test_instance_is_recycled_after_max_uses(self):
+        pool = BrowserPool(max_size=1, max_uses=2)
+        instance = pool.acquire()
+        pool.release(instance)
+        self.assertIs(pool.acquire(), instance)
+        pool.release(instance)
+        self.assertEqual(instance.quit_calls, 1)
+        self.assertIsNot(pool.acquire(), instance)
+
+    def test_acquire_times_out_when_the_pool_is_full(self):
+        pool = BrowserPool(max_size=1)
+        pool.acquire()
+        with self.assertRaises(TimeoutError):
+            pool.acquire(timeout=0.05)
+
+    def test_waiter_starts_a_browser_when_a_slot_is_freed(self):
+        pool = BrowserPool(max_size=1, max_uses=1)
+        instance = pool.acquire()
+        acquired = []
+        waiter = threading.Thread(target=lambda: acquired.append(pool.acquire(timeout=5)))
+        waiter.start()
+        pool.release(instance)
+        waiter.join(timeout=5)
+        self.assertEqual(len(acquired), 1)
+        self.assertIsNot(acquired[0], instance)
+
+    def test_browser_failure_in_reset_discards_the_instance(self):
+        pool = BrowserPool(max_size=1)
+        instance = pool.acquire()
+        instance.reset_error = WebDriverException("session gone")
+        pool.release(instance)
+        self.assertEqual(instance.quit_calls, 1)
+        self.assertIsNot(pool.acquire(timeout=0.05), instance)
+
+    def test_other_errors_in_reset_still_free_the_slot(self):
+        pool = BrowserPool(max_size=1)
+        instance = pool.acquire()
+        instance.reset_error = AttributeError("driver is None")
+        with self.assertRaises(AttributeError):
+            pool.release(instance)
+        self.assertEqual(instance.quit_calls, 1)
+        self.assertIsNot(pool.acquire(timeout=0.05), instance)
+
+    def test_debugger_address_is_rejected(self):
+        with self.assertRaises(ValueError):
+            BrowserPool(debugger_address="127.0.0.1:9222")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,25 @@
+import logging
+import unittest
+
+from lectra_automation import instance_logger
+
+
+class InstanceLoggerTest(unittest.TestCase):
+
+    def test_level_names_are_case_insensitive(self):
+        logger = instance_logger(object(), "debug")
+        self.assertEqual(logger.level, logging.DEBUG)
+        self.assertTrue(logger.isEnabledFor(logging.DEBUG))
+
+    def test_numeric_levels_are_kept(self):
+        logger = instance_logger(object(), logging.WARNING)
+        self.assertFalse(logger.isEnabledFor(logging.INFO))
+        self.assertTrue(logger.isEnabledFor(logging.WARNING))
+
+    def test_unknown_level_name_is_rejected(self):
+        with self.assertRaises(ValueError):
+            instance_logger(object(), "loud")
+
+
+if __name__ == "__main__":
+    unittest.main()